@@ -4,7 +4,9 @@
 #include <filesystem>
 #include <optional>
 #include <string>
+#include <string_view>
 #include <unordered_map>
+#include <utility>
 #include <variant>
 
 namespace mx4hyprland {
@@ -16,16 +18,54 @@ struct EventConfig {
 
 using EventValue = std::variant<int, EventConfig>;
 
+struct StringHash {
+    using is_transparent = void;
+
+    size_t operator()(std::string_view value) const noexcept {
+        return std::hash<std::string_view>{}(value);
+    }
+};
+
+struct EventArgsHash {
+    using is_transparent = void;
+
+    size_t operator()(std::pair<std::string_view, std::string_view> key) const noexcept {
+        size_t seed = std::hash<std::string_view>{}(key.first);
+        return seed ^ (std::hash<std::string_view>{}(key.second) + size_t{0x9e3779b9} + (seed << 6) + (seed >> 2));
+    }
+};
+
+struct EventArgsEqual {
+    using is_transparent = void;
+
+    bool operator()(
+        std::pair<std::string_view, std::string_view> lhs,
+        std::pair<std::string_view, std::string_view> rhs
+    ) const noexcept {
+        return lhs == rhs;
+    }
+};
+
 struct AppConfig {
     std::optional<int> default_effect;
-    std::unordered_map<std::string, EventValue> events;
 
     [[nodiscard]] std::optional<int> get_effect(
         std::string_view event_name,
         std::string_view event_args
     ) const;
 
+    [[nodiscard]] const std::unordered_map<std::string, EventValue>& events() const { return events_; }
+
     static AppConfig load(const std::optional<std::filesystem::path>& config_path = std::nullopt);
+
+private:
+    // Flattens `events_` into the lookup tables used by get_effect. Only
+    // load() fills `events_`, so the tables cannot drift from it.
+    void build_lookup();
+
+    std::unordered_map<std::string, EventValue> events_;
+    std::unordered_map<std::pair<std::string, std::string>, int, EventArgsHash, EventArgsEqual> by_event_args_;
+    std::unordered_map<std::string, int, StringHash, std::equal_to<>> by_event_default_;
 };
 
 [[nodiscard]] std::filesystem::path get_xdg_config_home();
@@ -3,10 +3,12 @@
 #include "mx_master_4.hpp"
 
 #include <atomic>
+#include <chrono>
 #include <condition_variable>
 #include <memory>
 #include <mutex>
 #include <queue>
+#include <span>
 #include <thread>
 
 namespace mx4hyprland {
@@ -28,7 +30,7 @@ public:
 
 private:
     void worker_loop(std::stop_token stop_token);
-    void safe_send(int effect_id);
+    bool safe_send(std::span<const int> effect_ids);
 
     std::unique_ptr<MXMaster4> device_;
     std::queue<int> queue_;
@@ -38,7 +40,12 @@ private:
     std::jthread worker_thread_;
     std::atomic<bool> running_{false};
 
-    static constexpr size_t MAX_QUEUE_SIZE = 10;
+    int last_effect_ = -1;
+    std::chrono::steady_clock::time_point last_sent_;
+
+    static constexpr size_t MAX_QUEUE_SIZE = 4;
+    static constexpr auto DUPLICATE_WINDOW = std::chrono::milliseconds(50);
+    static constexpr auto COALESCE_WINDOW = std::chrono::milliseconds(2);
 };
 
 }
@@ -8,6 +8,7 @@
 #include <functional>
 #include <memory>
 #include <mutex>
+#include <optional>
 #include <string>
 #include <thread>
 #include <unordered_map>
@@ -43,7 +44,9 @@ private:
     AppConfig config_;
     std::mutex config_mutex_;
 
-    std::unordered_map<std::string, std::string> event_cache_;
+    // Seeded with DEDUP_EVENTS, so a hit both marks the event as deduplicated
+    // and holds the args it was last seen with.
+    std::unordered_map<std::string, std::optional<std::string>, StringHash, std::equal_to<>> event_cache_;
 
     std::jthread listener_thread_;
     std::atomic<bool> running_{false};
@@ -3,6 +3,7 @@
 #include <atomic>
 #include <iostream>
 #include <mutex>
+#include <sstream>
 #include <string_view>
 
 namespace mx4hyprland {
@@ -46,10 +47,15 @@ public:
         if (!should_log(level)) {
             return;
         }
+        // std::cerr is unit-buffered, so format the whole line first and
+        // hand it over in a single write.
+        std::ostringstream line;
+        line << prefix;
+        ((line << std::forward<Args>(args)), ...);
+        line << '\n';
+
         std::lock_guard lock(mutex_);
-        std::cerr << prefix;
-        ((std::cerr << std::forward<Args>(args)), ...);
-        std::cerr << '\n';
+        std::cerr << line.view();
     }
 
     template<typename... Args>
@@ -54,6 +54,15 @@ public:
 
 using HidDevicePtr = std::unique_ptr<hid_device, HidDeviceDeleter>;
 
+class IoUringWriter;
+
+class IoUringWriterDeleter {
+public:
+    void operator()(IoUringWriter* writer) const;
+};
+
+using IoUringWriterPtr = std::unique_ptr<IoUringWriter, IoUringWriterDeleter>;
+
 class FileDescriptor {
 public:
     FileDescriptor() = default;
@@ -111,8 +120,12 @@ public:
 
     void open();
     void close();
+    void reconnect();
 
     void send_haptic_feedback(int effect_id = 1);
+    // `sent` counts the effects delivered, including when an exception
+    // is thrown part way through the batch.
+    void send_haptic_batch(std::span<const int> effect_ids, size_t& sent);
 
     [[nodiscard]] ConnectionType connection_type() const { return connection_type_; }
     [[nodiscard]] bool is_open() const;
@@ -124,6 +137,7 @@ private:
     static std::optional<std::filesystem::path> find_bluetooth_path();
 
     void write_bluetooth(std::span<const uint8_t> data);
+    void write_bluetooth_batch(std::span<const int> effect_ids, size_t& sent);
     void send_bolt_hidpp(FunctionID feature_idx, std::span<const uint8_t> args);
 
     ConnectionType connection_type_;
@@ -131,6 +145,7 @@ private:
     std::optional<int> device_idx_;
 
     std::variant<std::monostate, HidDevicePtr, FileDescriptor> device_;
+    IoUringWriterPtr uring_;
 };
 
 }
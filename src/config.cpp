@@ -28,29 +28,36 @@ std::optional<int> AppConfig::get_effect(
     std::string_view event_name,
     std::string_view event_args
 ) const {
-    auto it = events.find(std::string(event_name));
-    if (it == events.end()) {
-        return default_effect;
+    if (auto it = by_event_args_.find(std::pair{event_name, event_args}); it != by_event_args_.end()) {
+        return it->second;
     }
 
-    return std::visit(
-        [this, event_args](auto&& val) -> std::optional<int> {
-            using T = std::decay_t<decltype(val)>;
-            if constexpr (std::is_same_v<T, int>) {
-                return val;
-            } else {
-                auto arg_it = val.args.find(std::string(event_args));
-                if (arg_it != val.args.end()) {
-                    return arg_it->second;
-                }
-                if (val.default_effect) {
-                    return val.default_effect;
-                }
-                return default_effect;
-            }
-        },
-        it->second
-    );
+    if (auto it = by_event_default_.find(event_name); it != by_event_default_.end()) {
+        return it->second;
+    }
+
+    return default_effect;
+}
+
+void AppConfig::build_lookup() {
+    by_event_args_.clear();
+    by_event_default_.clear();
+
+    for (const auto& [event_name, value] : events_) {
+        if (const auto* effect = std::get_if<int>(&value)) {
+            by_event_default_.emplace(event_name, *effect);
+            continue;
+        }
+
+        const auto& event_config = std::get<EventConfig>(value);
+        for (const auto& [arg, effect] : event_config.args) {
+            by_event_args_.emplace(std::pair{event_name, arg}, effect);
+        }
+
+        if (event_config.default_effect) {
+            by_event_default_.emplace(event_name, *event_config.default_effect);
+        }
+    }
 }
 
 AppConfig AppConfig::load(const std::optional<std::filesystem::path>& config_path) {
@@ -81,7 +88,7 @@ AppConfig AppConfig::load(const std::optional<std::filesystem::path>& config_pat
                     std::string event_name(key.str());
 
                     if (auto effect_val = value.value<int64_t>()) {
-                        config.events[event_name] = static_cast<int>(*effect_val);
+                        config.events_[event_name] = static_cast<int>(*effect_val);
                     } else if (auto event_tbl = value.as_table()) {
                         EventConfig event_config;
 
@@ -98,11 +105,12 @@ AppConfig AppConfig::load(const std::optional<std::filesystem::path>& config_pat
                             }
                         }
 
-                        config.events[event_name] = std::move(event_config);
+                        config.events_[event_name] = std::move(event_config);
                     }
                 }
             }
 
+            config.build_lookup();
             logger().info("Config loaded from ", path.string());
             return config;
 
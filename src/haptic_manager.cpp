@@ -1,6 +1,9 @@
 #include "haptic_manager.hpp"
 #include "logger.hpp"
 
+#include <algorithm>
+#include <vector>
+
 namespace mx4hyprland {
 
 HapticManager::HapticManager(std::unique_ptr<MXMaster4> device)
@@ -16,6 +19,12 @@ void HapticManager::start() {
         return;
     }
 
+    try {
+        device_->open();
+    } catch (const std::exception& e) {
+        logger().warning("Failed to open device, will retry on first event: ", e.what());
+    }
+
     worker_thread_ = std::jthread([this](std::stop_token st) {
         worker_loop(st);
     });
@@ -41,11 +50,16 @@ void HapticManager::stop() {
 }
 
 void HapticManager::trigger(int effect_id) {
+    if (effect_id < EFFECT_MIN || effect_id > EFFECT_MAX) {
+        logger().warning("Ignoring invalid haptic effect: ", effect_id);
+        return;
+    }
+
     std::lock_guard lock(queue_mutex_);
 
     if (queue_.size() >= MAX_QUEUE_SIZE) {
-        logger().warning("Haptic queue full, dropping event");
-        return;
+        logger().debug("Haptic queue full, dropping oldest event");
+        queue_.pop();
     }
 
     queue_.push(effect_id);
@@ -53,8 +67,11 @@ void HapticManager::trigger(int effect_id) {
 }
 
 void HapticManager::worker_loop(std::stop_token stop_token) {
+    std::vector<int> batch;
+    batch.reserve(MAX_QUEUE_SIZE);
+
     while (!stop_token.stop_requested()) {
-        int effect_id = -1;
+        batch.clear();
 
         {
             std::unique_lock lock(queue_mutex_);
@@ -66,34 +83,55 @@ void HapticManager::worker_loop(std::stop_token stop_token) {
                 break;
             }
 
-            if (!queue_.empty()) {
-                effect_id = queue_.front();
+            // Give the rest of a burst a moment to arrive so it goes out in
+            // the same batch instead of one submission per event.
+            queue_cv_.wait_for(lock, stop_token, COALESCE_WINDOW, [this] {
+                return queue_.size() >= MAX_QUEUE_SIZE;
+            });
+
+            while (!queue_.empty()) {
+                batch.push_back(queue_.front());
                 queue_.pop();
             }
         }
 
-        if (effect_id >= 0) {
-            safe_send(effect_id);
+        auto [first, last] = std::ranges::unique(batch);
+        batch.erase(first, last);
+
+        if (!batch.empty() && batch.front() == last_effect_ &&
+            std::chrono::steady_clock::now() - last_sent_ < DUPLICATE_WINDOW) {
+            batch.erase(batch.begin());
+        }
+
+        if (!batch.empty() && safe_send(batch)) {
+            last_effect_ = batch.back();
+            last_sent_ = std::chrono::steady_clock::now();
         }
     }
 }
 
-void HapticManager::safe_send(int effect_id) {
+bool HapticManager::safe_send(std::span<const int> effect_ids) {
+    size_t sent = 0;
     try {
-        device_->send_haptic_feedback(effect_id);
+        device_->send_haptic_batch(effect_ids, sent);
+        return true;
     } catch (const DeviceDisconnectedError&) {
         logger().warning("Device disconnected, attempting reconnect...");
-        device_->close();
 
+        // Effects delivered before the failure already played; only
+        // resend the rest.
+        auto remaining = effect_ids.subspan(sent);
         try {
-            device_->open();
-            device_->send_haptic_feedback(effect_id);
+            device_->reconnect();
+            device_->send_haptic_batch(remaining, sent);
+            return true;
         } catch (const std::exception& e) {
             logger().error("Reconnect failed: ", e.what());
         }
     } catch (const std::exception& e) {
         logger().error("Unexpected HID error: ", e.what());
     }
+    return false;
 }
 
 }
@@ -1,14 +1,14 @@
 #include "hyprland_listener.hpp"
 #include "logger.hpp"
 
-#include <algorithm>
 #include <array>
 #include <cerrno>
 #include <chrono>
 #include <cstring>
+#include <poll.h>
+#include <sys/eventfd.h>
 #include <sys/socket.h>
 #include <sys/un.h>
-#include <thread>
 #include <unistd.h>
 
 namespace mx4hyprland {
@@ -16,6 +16,7 @@ namespace mx4hyprland {
 namespace {
 
 constexpr size_t BUFFER_SIZE = 4096;
+constexpr size_t MAX_READS_PER_WAKEUP = 4;
 constexpr auto RECONNECT_DELAY = std::chrono::seconds(3);
 constexpr auto SHORT_RECONNECT_DELAY = std::chrono::seconds(1);
 
@@ -62,6 +63,12 @@ private:
     int fd_;
 };
 
+// Sleeps for `delay` unless the wake eventfd is signalled first.
+void wait_for_wake(int wake_fd, std::chrono::milliseconds delay) {
+    pollfd fd{wake_fd, POLLIN, 0};
+    poll(&fd, 1, static_cast<int>(delay.count()));
+}
+
 }
 
 HyprlandListener::HyprlandListener(
@@ -70,7 +77,11 @@ HyprlandListener::HyprlandListener(
 )
     : manager_(std::move(manager))
     , config_(std::move(config))
-{}
+{
+    for (auto event : DEDUP_EVENTS) {
+        event_cache_.emplace(event, std::nullopt);
+    }
+}
 
 HyprlandListener::~HyprlandListener() {
     stop();
@@ -114,18 +125,29 @@ std::filesystem::path HyprlandListener::get_socket_path() const {
 }
 
 void HyprlandListener::listener_loop(std::stop_token stop_token) {
+    SocketRAII wake(eventfd(0, EFD_CLOEXEC | EFD_NONBLOCK));
+    if (!wake.valid()) {
+        logger().error("Failed to create eventfd: ", std::strerror(errno));
+        return;
+    }
+
+    std::stop_callback on_stop(stop_token, [fd = wake.get()] {
+        uint64_t one = 1;
+        [[maybe_unused]] auto res = ::write(fd, &one, sizeof(one));
+    });
+
     while (!stop_token.stop_requested()) {
         auto socket_path = get_socket_path();
         if (socket_path.empty()) {
             logger().error("HYPRLAND_INSTANCE_SIGNATURE not found");
-            std::this_thread::sleep_for(RECONNECT_DELAY);
+            wait_for_wake(wake.get(), RECONNECT_DELAY);
             continue;
         }
 
-        SocketRAII sock(socket(AF_UNIX, SOCK_STREAM, 0));
+        SocketRAII sock(socket(AF_UNIX, SOCK_STREAM | SOCK_CLOEXEC, 0));
         if (!sock.valid()) {
             logger().error("Failed to create socket: ", std::strerror(errno));
-            std::this_thread::sleep_for(RECONNECT_DELAY);
+            wait_for_wake(wake.get(), RECONNECT_DELAY);
             continue;
         }
 
@@ -135,7 +157,7 @@ void HyprlandListener::listener_loop(std::stop_token stop_token) {
 
         if (connect(sock.get(), reinterpret_cast<sockaddr*>(&addr), sizeof(addr)) < 0) {
             logger().warning("Hyprland socket unreachable, retrying...");
-            std::this_thread::sleep_for(RECONNECT_DELAY);
+            wait_for_wake(wake.get(), RECONNECT_DELAY);
             continue;
         }
 
@@ -143,34 +165,64 @@ void HyprlandListener::listener_loop(std::stop_token stop_token) {
 
         std::array<char, BUFFER_SIZE> buffer{};
         std::string line_buffer;
+        std::array<pollfd, 2> fds{{
+            {sock.get(), POLLIN, 0},
+            {wake.get(), POLLIN, 0},
+        }};
+
+        bool connected = true;
+        while (connected && !stop_token.stop_requested()) {
+            if (poll(fds.data(), fds.size(), -1) < 0) {
+                if (errno == EINTR) {
+                    continue;
+                }
+                logger().error("Socket poll error: ", std::strerror(errno));
+                break;
+            }
+
+            if (fds[1].revents != 0) {
+                break;
+            }
 
-        while (!stop_token.stop_requested()) {
-            ssize_t bytes_read = recv(sock.get(), buffer.data(), buffer.size() - 1, 0);
+            // Drain what is already queued on the socket, capped so a busy
+            // socket cannot grow the buffer without bound, then dispatch
+            // all complete lines in one pass. Anything left keeps the
+            // socket readable for the next poll.
+            for (size_t reads = 0; reads < MAX_READS_PER_WAKEUP; ++reads) {
+                ssize_t bytes_read = recv(sock.get(), buffer.data(), buffer.size(), MSG_DONTWAIT);
+
+                if (bytes_read > 0) {
+                    line_buffer.append(buffer.data(), static_cast<size_t>(bytes_read));
+                    continue;
+                }
+
+                if (bytes_read < 0 && (errno == EAGAIN || errno == EWOULDBLOCK)) {
+                    break;
+                }
+                if (bytes_read < 0 && errno == EINTR) {
+                    continue;
+                }
 
-            if (bytes_read <= 0) {
                 if (bytes_read == 0) {
                     logger().warning("Hyprland connection closed, reconnecting...");
                 } else {
                     logger().error("Socket read error: ", std::strerror(errno));
                 }
+                connected = false;
                 break;
             }
 
-            buffer[static_cast<size_t>(bytes_read)] = '\0';
-            line_buffer.append(buffer.data(), static_cast<size_t>(bytes_read));
-
+            std::string_view pending(line_buffer);
+            size_t consumed = 0;
             size_t pos;
-            while ((pos = line_buffer.find('\n')) != std::string::npos) {
-                std::string line = line_buffer.substr(0, pos);
-                line_buffer.erase(0, pos + 1);
-
-                if (line.find(">>") != std::string::npos) {
-                    process_event(line);
-                }
+            while ((pos = pending.find('\n', consumed)) != std::string_view::npos) {
+                process_event(pending.substr(consumed, pos - consumed));
+                consumed = pos + 1;
             }
+            line_buffer.erase(0, consumed);
         }
 
-        std::this_thread::sleep_for(SHORT_RECONNECT_DELAY);
+        wait_for_wake(wake.get(), SHORT_RECONNECT_DELAY);
     }
 }
 
@@ -180,19 +232,18 @@ void HyprlandListener::process_event(std::string_view raw_line) {
         return;
     }
 
-    std::string event(raw_line.substr(0, separator_pos));
-    std::string args(raw_line.substr(separator_pos + 2));
+    std::string_view event = raw_line.substr(0, separator_pos);
+    std::string_view args = raw_line.substr(separator_pos + 2);
 
-    bool should_dedup = std::ranges::any_of(DEDUP_EVENTS, [&event](std::string_view e) {
-        return e == event;
-    });
-
-    if (should_dedup) {
-        auto it = event_cache_.find(event);
-        if (it != event_cache_.end() && it->second == args) {
+    if (auto it = event_cache_.find(event); it != event_cache_.end()) {
+        if (it->second == args) {
             return;
         }
-        event_cache_[event] = args;
+        if (it->second) {
+            it->second->assign(args);
+        } else {
+            it->second.emplace(args);
+        }
     }
 
     std::optional<int> effect_id;
@@ -5,37 +5,26 @@
 #include "logger.hpp"
 #include "mx_master_4.hpp"
 
-#include <atomic>
 #include <csignal>
 #include <cstdlib>
 #include <filesystem>
 #include <memory>
 #include <string>
 #include <string_view>
-#include <thread>
 
 namespace {
 
-std::atomic<bool> g_should_stop{false};
-std::atomic<bool> g_should_reload{false};
-
-void signal_handler(int sig) {
-    if (sig == SIGHUP) {
-        g_should_reload.store(true);
-    } else {
-        g_should_stop.store(true);
-    }
-}
-
-void setup_signal_handlers() {
-    struct sigaction sa{};
-    sa.sa_handler = signal_handler;
-    sigemptyset(&sa.sa_mask);
-    sa.sa_flags = SA_RESTART;
-
-    sigaction(SIGINT, &sa, nullptr);
-    sigaction(SIGTERM, &sa, nullptr);
-    sigaction(SIGHUP, &sa, nullptr);
+sigset_t block_signals() {
+    sigset_t signals;
+    sigemptyset(&signals);
+    sigaddset(&signals, SIGINT);
+    sigaddset(&signals, SIGTERM);
+    sigaddset(&signals, SIGHUP);
+
+    // Blocked before any worker thread starts so every thread inherits the
+    // mask and the signals are only ever consumed by sigwait in main.
+    pthread_sigmask(SIG_BLOCK, &signals, nullptr);
+    return signals;
 }
 
 struct Args {
@@ -74,7 +63,7 @@ int main(int argc, char* argv[]) {
 
     mx4hyprland::logger().set_level(args.log_level);
 
-    setup_signal_handlers();
+    auto signals = block_signals();
 
     auto config = mx4hyprland::AppConfig::load(args.config_path);
 
@@ -107,13 +96,18 @@ int main(int argc, char* argv[]) {
 
     mx4hyprland::logger().info("mx4hyprland started");
 
-    while (!g_should_stop.load()) {
-        if (g_should_reload.exchange(false)) {
-            auto new_config = mx4hyprland::AppConfig::load(args.config_path);
-            hyprland_listener->update_config(std::move(new_config));
+    while (true) {
+        int sig = 0;
+        if (sigwait(&signals, &sig) != 0) {
+            continue;
+        }
+
+        if (sig != SIGHUP) {
+            break;
         }
 
-        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        auto new_config = mx4hyprland::AppConfig::load(args.config_path);
+        hyprland_listener->update_config(std::move(new_config));
     }
 
     mx4hyprland::logger().info("Shutting down...");
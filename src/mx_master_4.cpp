@@ -4,20 +4,51 @@
 #include <algorithm>
 #include <array>
 #include <cerrno>
+#include <chrono>
 #include <cstring>
 #include <fcntl.h>
-#include <iomanip>
-#include <sstream>
+#include <mutex>
+#include <sys/stat.h>
 #include <unistd.h>
+#include <unordered_map>
 
 #include <libudev.h>
 
+#ifdef HAVE_LIBURING
+#include <liburing.h>
+#endif
+
 namespace mx4hyprland {
 
 namespace {
 
 constexpr size_t HID_LONG_REPORT_SIZE = 20;
+constexpr size_t HIDPP_HEADER_SIZE = 4;
+constexpr size_t HIDPP_SHORT_PARAMS_SIZE = 3;
+constexpr uint8_t BLUETOOTH_DEVICE_INDEX = 0xFF;
+
+// The kernel formats HID_ID as "%04X:%08X:%08X", so these are compared
+// against the raw udev property without case folding.
+constexpr std::string_view LOGITECH_VID_HEX = "046D";
+constexpr std::string_view MX_MASTER_4_BLUETOOTH_PID_HEX = "B042";
+constexpr std::string_view BLUETOOTH_HID_ID_PADDED = "0005:0000046D:0000B042";
+constexpr std::string_view BLUETOOTH_HID_ID_UNPADDED = "0005:046D:B042";
+
+constexpr bool matches_hex(std::string_view hex, uint16_t value) {
+    constexpr std::string_view digits = "0123456789ABCDEF";
+    for (size_t i = 0; i < hex.size(); ++i) {
+        if (hex[i] != digits[(value >> (4 * (hex.size() - 1 - i))) & 0xF]) {
+            return false;
+        }
+    }
+    return hex.size() == 4;
+}
+
+static_assert(matches_hex(LOGITECH_VID_HEX, LOGITECH_VID));
+static_assert(matches_hex(MX_MASTER_4_BLUETOOTH_PID_HEX, MX_MASTER_4_BLUETOOTH_PID));
+constexpr unsigned URING_QUEUE_DEPTH = 16;
 constexpr uint16_t HIDPP_USAGE_PAGE = 65280;
+constexpr auto BOLT_ENUMERATE_TTL = std::chrono::seconds(3);
 
 class UdevDeleter {
 public:
@@ -50,6 +81,168 @@ using UdevPtr = std::unique_ptr<udev, UdevDeleter>;
 using UdevEnumeratePtr = std::unique_ptr<udev_enumerate, UdevEnumerateDeleter>;
 using UdevDevicePtr = std::unique_ptr<udev_device, UdevDeviceDeleter>;
 
+using HidppPacket = std::array<uint8_t, HID_LONG_REPORT_SIZE>;
+
+constexpr HidppPacket make_hidpp_packet(ReportID report_id, uint8_t device_idx, FunctionID feature_idx) {
+    HidppPacket packet{};
+    packet[0] = static_cast<uint8_t>(report_id);
+    packet[1] = device_idx;
+    packet[2] = static_cast<uint8_t>((static_cast<uint16_t>(feature_idx) >> 8) & 0xFF);
+    packet[3] = static_cast<uint8_t>(static_cast<uint16_t>(feature_idx) & 0xFF);
+    return packet;
+}
+
+constexpr auto BLUETOOTH_HAPTIC_PACKETS = [] {
+    std::array<HidppPacket, EFFECT_MAX - EFFECT_MIN + 1> packets{};
+    for (size_t i = 0; i < packets.size(); ++i) {
+        packets[i] = make_hidpp_packet(ReportID::Long, BLUETOOTH_DEVICE_INDEX, FunctionID::Haptic);
+        packets[i][HIDPP_HEADER_SIZE] = static_cast<uint8_t>(EFFECT_MIN + static_cast<int>(i));
+    }
+    return packets;
+}();
+
+static_assert(BLUETOOTH_HAPTIC_PACKETS[1][0] == 0x11 && BLUETOOTH_HAPTIC_PACKETS[1][1] == 0xFF &&
+              BLUETOOTH_HAPTIC_PACKETS[1][2] == 0x0B && BLUETOOTH_HAPTIC_PACKETS[1][3] == 0x4E &&
+              BLUETOOTH_HAPTIC_PACKETS[1][4] == 0x01);
+
+const HidppPacket& bluetooth_haptic_packet(int effect_id) {
+    return BLUETOOTH_HAPTIC_PACKETS[static_cast<size_t>(effect_id - EFFECT_MIN)];
+}
+
+// Only the absence of a receiver is cached: a hidraw path that worked
+// before may have been reused by another device, so a present receiver is
+// always located by a fresh enumeration.
+struct BoltDeviceCache {
+    std::mutex mutex;
+    std::optional<std::chrono::steady_clock::time_point> last_miss;
+};
+
+BoltDeviceCache& bolt_device_cache() {
+    static BoltDeviceCache cache;
+    return cache;
+}
+
+struct BluetoothCandidate {
+    int64_t uevent_mtime_ns = 0;
+    std::optional<std::filesystem::path> devnode;
+};
+
+struct BluetoothPathCache {
+    std::mutex mutex;
+    std::unordered_map<std::string, BluetoothCandidate> candidates;
+    std::string last_syspath;
+};
+
+BluetoothPathCache& bluetooth_path_cache() {
+    static BluetoothPathCache cache;
+    return cache;
+}
+
+std::optional<int64_t> uevent_mtime_ns(const std::string& syspath) {
+    struct stat st{};
+    if (::stat((syspath + "/uevent").c_str(), &st) != 0) {
+        return std::nullopt;
+    }
+    return static_cast<int64_t>(st.st_mtim.tv_sec) * 1'000'000'000 + st.st_mtim.tv_nsec;
+}
+
+void forget_bluetooth_path(const std::filesystem::path& devnode) {
+    auto& cache = bluetooth_path_cache();
+    std::lock_guard lock(cache.mutex);
+
+    std::erase_if(cache.candidates, [&devnode](const auto& item) {
+        return item.second.devnode == devnode;
+    });
+
+    if (!cache.candidates.contains(cache.last_syspath)) {
+        cache.last_syspath.clear();
+    }
+}
+
+std::optional<std::filesystem::path> probe_bluetooth_hidraw(udev_device* hidraw_dev) {
+    const char* syspath = udev_device_get_syspath(hidraw_dev);
+    const char* devnode = udev_device_get_devnode(hidraw_dev);
+    logger().debug("Checking hidraw device: ", syspath, " -> ", devnode ? devnode : "no devnode");
+
+    udev_device* hid_dev = udev_device_get_parent_with_subsystem_devtype(
+        hidraw_dev, "hid", nullptr
+    );
+
+    if (hid_dev == nullptr) {
+        logger().debug("  No HID parent found");
+        return std::nullopt;
+    }
+
+    // HID_NAME comes from the uevent udev has already parsed; the "name"
+    // sysattr costs an extra sysfs lookup and is rarely present on hid nodes.
+    std::string name;
+    if (const char* hid_name_prop = udev_device_get_property_value(hid_dev, "HID_NAME")) {
+        name = hid_name_prop;
+    } else if (const char* hid_name = udev_device_get_sysattr_value(hid_dev, "name")) {
+        name = hid_name;
+    }
+
+    if (name.empty()) {
+        const char* hid_id = udev_device_get_property_value(hid_dev, "HID_ID");
+        if (hid_id != nullptr) {
+            std::string_view hid_id_str(hid_id);
+            if (hid_id_str.find(LOGITECH_VID_HEX) != std::string_view::npos &&
+                hid_id_str.find(MX_MASTER_4_BLUETOOTH_PID_HEX) != std::string_view::npos) {
+                logger().debug("  No name but HID_ID matches VID/PID, using as candidate");
+                name = "MX Master 4 (detected by ID)";
+            }
+        }
+    }
+
+    if (name.empty()) {
+        logger().debug("  HID parent has no name");
+        return std::nullopt;
+    }
+
+    logger().debug("  HID name: ", name);
+
+    if (name.find(MX_MASTER_4_BLUETOOTH_NAME) == std::string::npos &&
+        name.find("detected by ID") == std::string::npos) {
+        return std::nullopt;
+    }
+
+    logger().debug("  Name matches! Checking IDs...");
+
+    const char* hid_id = udev_device_get_property_value(hid_dev, "HID_ID");
+    const char* modalias = udev_device_get_property_value(hid_dev, "MODALIAS");
+
+    logger().debug("  HID_ID: ", hid_id ? hid_id : "(null)");
+    logger().debug("  MODALIAS: ", modalias ? modalias : "(null)");
+
+    if (hid_id != nullptr) {
+        std::string_view hid_id_str(hid_id);
+
+        logger().debug("  Looking for: ", BLUETOOTH_HID_ID_PADDED, " or ", BLUETOOTH_HID_ID_UNPADDED);
+
+        if (hid_id_str.find(BLUETOOTH_HID_ID_PADDED) != std::string_view::npos ||
+            hid_id_str.find(BLUETOOTH_HID_ID_UNPADDED) != std::string_view::npos) {
+            if (devnode != nullptr) {
+                logger().info("Found Bluetooth device: ", name, " at ", devnode);
+                return std::filesystem::path(devnode);
+            }
+        }
+    }
+
+    if (modalias != nullptr) {
+        std::string_view modalias_str(modalias);
+
+        if (modalias_str.find(BLUETOOTH_HID_ID_PADDED) != std::string_view::npos) {
+            if (devnode != nullptr) {
+                logger().info("Found Bluetooth device: ", name, " at ", devnode);
+                return std::filesystem::path(devnode);
+            }
+        }
+    }
+
+    logger().debug("  ID mismatch, skipping");
+    return std::nullopt;
+}
+
 }
 
 void FileDescriptor::close() {
@@ -59,6 +252,100 @@ void FileDescriptor::close() {
     }
 }
 
+class IoUringWriter {
+public:
+    IoUringWriter() = default;
+    IoUringWriter(const IoUringWriter&) = delete;
+    IoUringWriter& operator=(const IoUringWriter&) = delete;
+
+#ifdef HAVE_LIBURING
+    ~IoUringWriter() {
+        if (initialized_) {
+            io_uring_queue_exit(&ring_);
+        }
+    }
+
+    static IoUringWriterPtr create() {
+        IoUringWriterPtr writer(new IoUringWriter());
+        int res = io_uring_queue_init(URING_QUEUE_DEPTH, &writer->ring_, 0);
+        if (res < 0) {
+            logger().debug("io_uring unavailable, using plain writes: ", std::strerror(-res));
+            return nullptr;
+        }
+        writer->initialized_ = true;
+        return writer;
+    }
+
+    // Submits the haptic packet of every effect as one linked chain and
+    // waits for all of them. Returns 0 on success or a negative errno;
+    // `completed` counts the packets delivered before any failure.
+    int write_all(int fd, std::span<const int> effect_ids, size_t& completed) {
+        completed = 0;
+        while (!effect_ids.empty()) {
+            auto chunk = effect_ids.first(std::min<size_t>(effect_ids.size(), URING_QUEUE_DEPTH));
+            effect_ids = effect_ids.subspan(chunk.size());
+
+            for (size_t i = 0; i < chunk.size(); ++i) {
+                io_uring_sqe* sqe = io_uring_get_sqe(&ring_);
+                if (sqe == nullptr) {
+                    return -EBUSY;
+                }
+                const auto& packet = bluetooth_haptic_packet(chunk[i]);
+                io_uring_prep_write(sqe, fd, packet.data(), HID_LONG_REPORT_SIZE, 0);
+                sqe->user_data = i;
+                if (i + 1 < chunk.size()) {
+                    io_uring_sqe_set_flags(sqe, IOSQE_IO_LINK);
+                }
+            }
+
+            int res = io_uring_submit_and_wait(&ring_, static_cast<unsigned>(chunk.size()));
+            if (res < 0) {
+                return res;
+            }
+
+            // Links run in order, so everything before the first failed
+            // SQE was delivered and everything after it was cancelled.
+            int result = 0;
+            size_t delivered = chunk.size();
+            unsigned head = 0;
+            unsigned seen = 0;
+            io_uring_cqe* cqe = nullptr;
+            io_uring_for_each_cqe(&ring_, head, cqe) {
+                if (static_cast<size_t>(cqe->res) != HID_LONG_REPORT_SIZE && cqe->user_data < delivered) {
+                    delivered = static_cast<size_t>(cqe->user_data);
+                    result = cqe->res < 0 ? cqe->res : -EIO;
+                }
+                ++seen;
+            }
+            io_uring_cq_advance(&ring_, seen);
+
+            completed += delivered;
+            if (result < 0) {
+                return result;
+            }
+        }
+        return 0;
+    }
+
+private:
+    io_uring ring_{};
+    bool initialized_ = false;
+#else
+    static IoUringWriterPtr create() {
+        return nullptr;
+    }
+
+    int write_all(int, std::span<const int>, size_t& completed) {
+        completed = 0;
+        return -ENOSYS;
+    }
+#endif
+};
+
+void IoUringWriterDeleter::operator()(IoUringWriter* writer) const {
+    delete writer;
+}
+
 MXMaster4::MXMaster4(
     ConnectionType type,
     std::filesystem::path path,
@@ -94,8 +381,17 @@ std::optional<MXMaster4> MXMaster4::find(
 }
 
 std::optional<MXMaster4> MXMaster4::find_bolt_device() {
+    auto& cache = bolt_device_cache();
+    std::lock_guard lock(cache.mutex);
+
+    auto now = std::chrono::steady_clock::now();
+    if (cache.last_miss && now - *cache.last_miss < BOLT_ENUMERATE_TTL) {
+        return std::nullopt;
+    }
+
     hid_device_info* devs = hid_enumerate(LOGITECH_VID, 0);
     if (devs == nullptr) {
+        cache.last_miss = now;
         return std::nullopt;
     }
 
@@ -110,10 +406,31 @@ std::optional<MXMaster4> MXMaster4::find_bolt_device() {
     }
 
     hid_free_enumeration(devs);
+
+    if (result) {
+        cache.last_miss.reset();
+    } else {
+        cache.last_miss = now;
+    }
     return result;
 }
 
 std::optional<std::filesystem::path> MXMaster4::find_bluetooth_path() {
+    auto& cache = bluetooth_path_cache();
+    std::lock_guard lock(cache.mutex);
+
+    if (!cache.last_syspath.empty()) {
+        auto it = cache.candidates.find(cache.last_syspath);
+        auto mtime = uevent_mtime_ns(cache.last_syspath);
+        if (it != cache.candidates.end() && it->second.devnode && mtime &&
+            *mtime == it->second.uevent_mtime_ns &&
+            std::filesystem::exists(*it->second.devnode)) {
+            logger().debug("Reusing last Bluetooth device: ", it->second.devnode->string());
+            return it->second.devnode;
+        }
+        cache.last_syspath.clear();
+    }
+
     UdevPtr udev_ctx(udev_new());
     if (!udev_ctx) {
         logger().error("Failed to create udev context");
@@ -129,121 +446,43 @@ std::optional<std::filesystem::path> MXMaster4::find_bluetooth_path() {
     udev_enumerate_add_match_subsystem(enumerate.get(), "hidraw");
     udev_enumerate_scan_devices(enumerate.get());
 
-    std::ostringstream vid_ss;
-    vid_ss << std::uppercase << std::hex << std::setfill('0') << std::setw(4) << LOGITECH_VID;
-    std::string vid_hex = vid_ss.str();
-
-    std::ostringstream pid_ss;
-    pid_ss << std::uppercase << std::hex << std::setfill('0') << std::setw(4) << MX_MASTER_4_BLUETOOTH_PID;
-    std::string pid_hex = pid_ss.str();
-
-    std::string target_modalias_part = "0005:0000" + vid_hex + ":0000" + pid_hex;
-    std::transform(target_modalias_part.begin(), target_modalias_part.end(),
-                   target_modalias_part.begin(), ::toupper);
-
-    logger().debug("Looking for Bluetooth device with modalias containing: ", target_modalias_part);
+    logger().debug("Looking for Bluetooth device with modalias containing: ", BLUETOOTH_HID_ID_PADDED);
 
     udev_list_entry* devices = udev_enumerate_get_list_entry(enumerate.get());
     udev_list_entry* entry = nullptr;
 
     udev_list_entry_foreach(entry, devices) {
-        const char* syspath = udev_list_entry_get_name(entry);
-        UdevDevicePtr hidraw_dev(udev_device_new_from_syspath(udev_ctx.get(), syspath));
-
-        if (!hidraw_dev) {
-            continue;
-        }
-
-        const char* devnode = udev_device_get_devnode(hidraw_dev.get());
-        logger().debug("Checking hidraw device: ", syspath, " -> ", devnode ? devnode : "no devnode");
-
-        udev_device* hid_dev = udev_device_get_parent_with_subsystem_devtype(
-            hidraw_dev.get(), "hid", nullptr
-        );
-
-        if (hid_dev == nullptr) {
-            logger().debug("  No HID parent found");
-            continue;
-        }
-
-        const char* hid_name = udev_device_get_sysattr_value(hid_dev, "name");
-        const char* hid_name_prop = udev_device_get_property_value(hid_dev, "HID_NAME");
-
-        std::string name;
-        if (hid_name != nullptr) {
-            name = hid_name;
-        } else if (hid_name_prop != nullptr) {
-            name = hid_name_prop;
-        }
-
-        if (name.empty()) {
-            const char* hid_id = udev_device_get_property_value(hid_dev, "HID_ID");
-            if (hid_id != nullptr) {
-                std::string hid_id_upper(hid_id);
-                std::transform(hid_id_upper.begin(), hid_id_upper.end(),
-                               hid_id_upper.begin(), ::toupper);
-                if (hid_id_upper.find(vid_hex) != std::string::npos &&
-                    hid_id_upper.find(pid_hex) != std::string::npos) {
-                    logger().debug("  No name but HID_ID matches VID/PID, using as candidate");
-                    name = "MX Master 4 (detected by ID)";
+        std::string syspath(udev_list_entry_get_name(entry));
+        auto mtime = uevent_mtime_ns(syspath);
+
+        if (mtime) {
+            auto it = cache.candidates.find(syspath);
+            if (it != cache.candidates.end() && it->second.uevent_mtime_ns == *mtime) {
+                if (it->second.devnode) {
+                    logger().debug("Found cached Bluetooth device at ", it->second.devnode->string());
+                    cache.last_syspath = syspath;
+                    return it->second.devnode;
                 }
+                continue;
             }
         }
 
-        if (name.empty()) {
-            logger().debug("  HID parent has no name");
-            continue;
-        }
-
-        logger().debug("  HID name: ", name);
+        UdevDevicePtr hidraw_dev(udev_device_new_from_syspath(udev_ctx.get(), syspath.c_str()));
 
-        if (name.find(MX_MASTER_4_BLUETOOTH_NAME) == std::string::npos &&
-            name.find("detected by ID") == std::string::npos) {
+        if (!hidraw_dev) {
             continue;
         }
 
-        logger().debug("  Name matches! Checking IDs...");
-
-        const char* hid_id = udev_device_get_property_value(hid_dev, "HID_ID");
-        const char* modalias = udev_device_get_property_value(hid_dev, "MODALIAS");
-
-        logger().debug("  HID_ID: ", hid_id ? hid_id : "(null)");
-        logger().debug("  MODALIAS: ", modalias ? modalias : "(null)");
-
-        if (hid_id != nullptr) {
-            std::string hid_id_str(hid_id);
-            std::transform(hid_id_str.begin(), hid_id_str.end(),
-                           hid_id_str.begin(), ::toupper);
-
-            std::string target_padded = "0005:0000" + vid_hex + ":0000" + pid_hex;
-            std::string target_unpadded = "0005:" + vid_hex + ":" + pid_hex;
-
-            logger().debug("  Looking for: ", target_padded, " or ", target_unpadded);
-            logger().debug("  Got: ", hid_id_str);
+        auto devnode = probe_bluetooth_hidraw(hidraw_dev.get());
 
-            if (hid_id_str.find(target_padded) != std::string::npos ||
-                hid_id_str.find(target_unpadded) != std::string::npos) {
-                if (devnode != nullptr) {
-                    logger().info("Found Bluetooth device: ", name, " at ", devnode);
-                    return std::filesystem::path(devnode);
-                }
-            }
+        if (mtime) {
+            cache.candidates[syspath] = BluetoothCandidate{*mtime, devnode};
         }
 
-        if (modalias != nullptr) {
-            std::string modalias_str(modalias);
-            std::transform(modalias_str.begin(), modalias_str.end(),
-                           modalias_str.begin(), ::toupper);
-
-            if (modalias_str.find(target_modalias_part) != std::string::npos) {
-                if (devnode != nullptr) {
-                    logger().info("Found Bluetooth device: ", name, " at ", devnode);
-                    return std::filesystem::path(devnode);
-                }
-            }
+        if (devnode) {
+            cache.last_syspath = syspath;
+            return devnode;
         }
-
-        logger().debug("  ID mismatch, skipping");
     }
 
     logger().debug("Bluetooth device not found via udev");
@@ -263,7 +502,7 @@ void MXMaster4::open() {
         device_ = HidDevicePtr(raw_dev);
         logger().info("Connected via Bolt");
     } else {
-        int fd = ::open(device_path_.c_str(), O_WRONLY | O_NONBLOCK);
+        int fd = ::open(device_path_.c_str(), O_WRONLY | O_NONBLOCK | O_CLOEXEC);
         if (fd < 0) {
             throw DeviceDisconnectedError(
                 "Failed to open Bluetooth device: " + device_path_.string() +
@@ -272,6 +511,10 @@ void MXMaster4::open() {
         }
         device_ = FileDescriptor(fd);
         logger().info("Connected via Bluetooth");
+
+        if (!uring_) {
+            uring_ = IoUringWriter::create();
+        }
     }
 }
 
@@ -279,6 +522,21 @@ void MXMaster4::close() {
     device_ = std::monostate{};
 }
 
+void MXMaster4::reconnect() {
+    close();
+
+    // Never reopen device_path_ blindly: hidraw minors are reused, so after
+    // a disconnect the old node may belong to another HID device. find()
+    // only hands back a cached path while its sysfs entry is unchanged.
+    auto found = find(connection_type_);
+    if (!found) {
+        throw DeviceDisconnectedError("MX Master 4 not found");
+    }
+
+    *this = std::move(*found);
+    open();
+}
+
 bool MXMaster4::is_open() const {
     return std::visit(
         [](auto&& arg) -> bool {
@@ -304,32 +562,57 @@ void MXMaster4::write_bluetooth(std::span<const uint8_t> data) {
     ssize_t written = ::write(fd_ptr->get(), data.data(), data.size());
 
     if (written < 0) {
-        if (errno == ENODEV || errno == EIO) {
+        int err = errno;
+        forget_bluetooth_path(device_path_);
+        if (err == ENODEV || err == EIO) {
             throw DeviceDisconnectedError("Device disconnected");
         }
         throw DeviceDisconnectedError(
-            "Failed to write to Bluetooth device: " + std::string(std::strerror(errno))
+            "Failed to write to Bluetooth device: " + std::string(std::strerror(err))
         );
     }
 
     if (static_cast<size_t>(written) != data.size()) {
+        forget_bluetooth_path(device_path_);
         throw DeviceDisconnectedError("Incomplete write to Bluetooth device");
     }
 }
 
+void MXMaster4::write_bluetooth_batch(std::span<const int> effect_ids, size_t& sent) {
+    auto* fd_ptr = std::get_if<FileDescriptor>(&device_);
+    if (fd_ptr == nullptr || !fd_ptr->valid()) {
+        throw DeviceDisconnectedError("Bluetooth device is not open");
+    }
+
+    int res = uring_->write_all(fd_ptr->get(), effect_ids, sent);
+    if (res < 0) {
+        // Completions of a failed submission may still be queued in the
+        // ring; drop it so they are not read back as the next batch's.
+        // open() creates a fresh one.
+        uring_.reset();
+        forget_bluetooth_path(device_path_);
+        if (res == -ENODEV || res == -EIO || res == -ECANCELED) {
+            throw DeviceDisconnectedError("Device disconnected");
+        }
+        throw DeviceDisconnectedError(
+            "Failed to write to Bluetooth device: " + std::string(std::strerror(-res))
+        );
+    }
+}
+
 void MXMaster4::send_bolt_hidpp(FunctionID feature_idx, std::span<const uint8_t> args) {
     auto* hid_ptr = std::get_if<HidDevicePtr>(&device_);
     if (hid_ptr == nullptr || !(*hid_ptr)) {
         throw DeviceDisconnectedError("Bolt device is not open");
     }
 
-    std::array<uint8_t, HID_LONG_REPORT_SIZE> packet{};
-    packet[0] = static_cast<uint8_t>(args.size() <= 3 ? ReportID::Short : ReportID::Long);
-    packet[1] = static_cast<uint8_t>(device_idx_.value_or(0));
-    packet[2] = static_cast<uint8_t>((static_cast<uint16_t>(feature_idx) >> 8) & 0xFF);
-    packet[3] = static_cast<uint8_t>(static_cast<uint16_t>(feature_idx) & 0xFF);
+    if (args.size() > HID_LONG_REPORT_SIZE - HIDPP_HEADER_SIZE) {
+        throw std::invalid_argument("HID++ parameters do not fit in a long report");
+    }
 
-    std::copy(args.begin(), args.end(), packet.begin() + 4);
+    auto report_id = args.size() <= HIDPP_SHORT_PARAMS_SIZE ? ReportID::Short : ReportID::Long;
+    auto packet = make_hidpp_packet(report_id, static_cast<uint8_t>(device_idx_.value_or(0)), feature_idx);
+    std::ranges::copy(args, packet.begin() + HIDPP_HEADER_SIZE);
 
     int res = hid_write(hid_ptr->get(), packet.data(), packet.size());
     if (res < 0) {
@@ -356,15 +639,30 @@ void MXMaster4::send_haptic_feedback(int effect_id) {
         std::array<uint8_t, 1> args = {static_cast<uint8_t>(effect_id)};
         send_bolt_hidpp(FunctionID::Haptic, args);
     } else {
-        std::array<uint8_t, HID_LONG_REPORT_SIZE> packet{};
-        packet[0] = static_cast<uint8_t>(ReportID::Long);
-        packet[1] = 0xFF;
-        packet[2] = 0x0B;
-        packet[3] = 0x4E;
-        packet[4] = static_cast<uint8_t>(effect_id);
+        write_bluetooth(bluetooth_haptic_packet(effect_id));
+    }
+}
 
-        write_bluetooth(packet);
+void MXMaster4::send_haptic_batch(std::span<const int> effect_ids, size_t& sent) {
+    sent = 0;
+
+    if (std::ranges::any_of(effect_ids, [](int id) { return id < EFFECT_MIN || id > EFFECT_MAX; })) {
+        throw std::invalid_argument("effect_id must be between 0 and 15");
+    }
+
+    if (!is_open()) {
+        open();
     }
+
+    if (connection_type_ == ConnectionType::Bolt || !uring_ || effect_ids.size() == 1) {
+        for (int effect_id : effect_ids) {
+            send_haptic_feedback(effect_id);
+            ++sent;
+        }
+        return;
+    }
+
+    write_bluetooth_batch(effect_ids, sent);
 }
 
 }